@@ -24,6 +24,9 @@ from .grammar import PVLGrammar, ODLGrammar, PDSGrammar, ISISGrammar
 from .token import Token
 from .decoder import PVLDecoder, ODLDecoder, PDSLabelDecoder
 
+# The maximum number of entries in an encoder's memoized string results.
+_CACHE_SIZE = 4096
+
 
 class QuantTup(namedtuple("QuantTup", ["cls", "value_prop", "units_prop"])):
     """
@@ -34,6 +37,24 @@ class QuantTup(namedtuple("QuantTup", ["cls", "value_prop", "units_prop"])):
     """
 
 
+def _memoize(cache: dict, func, value: str) -> str:
+    """Returns the result of *func* applied to *value*, looking it up
+    in, or adding it to, the dict-like *cache*.  The *cache* stops
+    growing once it has _CACHE_SIZE entries.  If *cache* is None,
+    nothing is memoized.
+    """
+    if cache is None:
+        return func(value)
+
+    try:
+        return cache[value]
+    except KeyError:
+        result = func(value)
+        if len(cache) < _CACHE_SIZE:
+            cache[value] = result
+        return result
+
+
 class PVLEncoder(object):
     """An encoder based on the rules in the CCSDS-641.0-B-2 'Blue Book'
     which defines the PVL language.
@@ -103,6 +124,18 @@ class PVLEncoder(object):
         self.aggregation_end = aggregation_end
         self.newline = newline
 
+        # Indentation prefixes, indexed by level, grown on demand by
+        # format() and rebuilt if the indent unit they were made from
+        # has changed.
+        self._indent_unit = ""
+        self._indents = [""]
+
+        # Memoized results of encode_string() and encode_units(), which
+        # are only dicts while encode() is running.  Labels tend to
+        # repeat the same string values and units many times over.
+        self._string_cache = None
+        self._units_cache = None
+
         # This list of 3-tuples *always* has our own pvl quantity object,
         # and should *only* be added to with self.add_quantity_cls().
         self.quantities = [QuantTup(Quantity, "value", "units")]
@@ -130,6 +163,35 @@ class PVLEncoder(object):
         # Finally, let's keep track of everything we consider "numerical":
         self.numeric_types = (int, float, self.decoder.real_cls, Decimal)
 
+        # Any of these characters or comment delimiters in a string
+        # means that it must be quoted.
+        quote_chars = re.escape(
+            "".join(self.grammar.whitespace + self.grammar.reserved_characters)
+        )
+        comment_delims = (
+            re.escape(d) for pair in self.grammar.comments for d in pair
+        )
+        self._quote_re = re.compile(
+            "|".join((f"[{quote_chars}]", *comment_delims))
+        )
+
+        # Lookup table of exact types for encode_simple_value(), values
+        # whose type isn't here fall through to isinstance() tests.
+        # The numeric entries are taken from self.numeric_types as it is
+        # right now, so later changes to that attribute are not reflected
+        # here, only in the isinstance() fallback.
+        self._simple_encoders = {
+            set: self.encode_set,
+            frozenset: self.encode_set,
+            list: self.encode_sequence,
+            datetime.datetime: self.encode_datetype,
+            datetime.date: self.encode_datetype,
+            datetime.time: self.encode_datetype,
+            bool: self.encode_bool,
+            str: self._encode_string_cached,
+        }
+        self._simple_encoders.update(dict.fromkeys(self.numeric_types, str))
+
     def _import_quantities(self):
         warn_str = (
             "The {} library is not present, so {} objects will "
@@ -189,9 +251,20 @@ class PVLEncoder(object):
         It uses the textwrap library to wrap long lines.
         """
 
-        prefix = level * (self.indent * " ")
+        unit = self.indent * " "
+        if unit != self._indent_unit:
+            self._indent_unit = unit
+            self._indents = [""]
+
+        indents = self._indents
+        while len(indents) <= level:
+            indents.append(indents[-1] + unit)
+        prefix = indents[level]
 
-        if len(prefix + s + self.newline) > self.width and "=" in s:
+        if (
+            len(prefix) + len(s) + len(self.newline) > self.width
+            and "=" in s
+        ):
             (preq, _, posteq) = s.partition("=")
             new_prefix = prefix + preq.strip() + " = "
 
@@ -214,7 +287,16 @@ class PVLEncoder(object):
         according to the rules of this encoder.
         """
         lines = list()
-        lines.append(self.encode_module(module, 0))
+
+        # Results are only memoized for the duration of this call, so
+        # that configuration changes between calls are always honored.
+        self._string_cache = dict()
+        self._units_cache = dict()
+        try:
+            lines.append(self.encode_module(module, 0))
+        finally:
+            self._string_cache = None
+            self._units_cache = None
 
         end_line = self.grammar.end_statements[0]
         if self.end_delimiter:
@@ -222,19 +304,21 @@ class PVLEncoder(object):
 
         lines.append(end_line)
 
-        # Final check to ensure we're sending out the right character set:
+        # Final check to ensure we're sending out the right character set,
+        # each distinct character only needs to be checked once:
         s = self.newline.join(lines)
 
-        for i, c in enumerate(s):
-            if not self.grammar.char_allowed(c):
-                raise ValueError(
-                    "Encountered a character that was not "
-                    "a valid character according to the "
-                    'grammar: "{}", it is in: '
-                    '"{}"'.format(c, s[i - 5, i + 5])
-                )
+        bad_chars = [c for c in set(s) if not self.grammar.char_allowed(c)]
+        if bad_chars:
+            i = min(s.index(c) for c in bad_chars)
+            raise ValueError(
+                "Encountered a character that was not "
+                "a valid character according to the "
+                'grammar: "{}", it is in: '
+                '"{}"'.format(s[i], s[max(i - 5, 0):i + 5])
+            )
 
-        return self.newline.join(lines)
+        return s
 
     def encode_module(self, module: abc.Mapping, level: int = 0) -> str:
         """Returns a ``str`` formatted as a PVL module based
@@ -247,13 +331,16 @@ class PVLEncoder(object):
         # To align things on the equals sign, just need to normalize
         # the non-aggregation key length:
 
-        non_agg_key_lengths = list()
-        for k, v in module.items():
-            if not isinstance(v, abc.Mapping):
-                non_agg_key_lengths.append(len(k))
-        longest_key_len = max(non_agg_key_lengths, default=0)
+        # Walk the module only once, the two loops below are over
+        # a plain list.
+        items = list(module.items())
 
-        for k, v in module.items():
+        longest_key_len = 0
+        for k, v in items:
+            if not isinstance(v, abc.Mapping) and len(k) > longest_key_len:
+                longest_key_len = len(k)
+
+        for k, v in items:
             if isinstance(v, abc.Mapping):
                 lines.append(self.encode_aggregation_block(k, v, level))
             else:
@@ -280,20 +367,16 @@ class PVLEncoder(object):
         else:
             raise ValueError("The value {value} is not dict-like.")
 
-        agg_begin = "{} = {}".format(agg_keywords[0], key)
-        if self.end_delimiter:
-            agg_begin += self.grammar.delimiters[0]
-        lines.append(self.format(agg_begin, level))
+        delim = self.grammar.delimiters[0] if self.end_delimiter else ""
+
+        lines.append(self.format(f"{agg_keywords[0]} = {key}{delim}", level))
 
         lines.append(self.encode_module(value, (level + 1)))
 
-        agg_end = ""
         if self.aggregation_end:
-            agg_end += "{} = {}".format(agg_keywords[1], key)
+            agg_end = f"{agg_keywords[1]} = {key}{delim}"
         else:
-            agg_end += agg_keywords[1]
-        if self.end_delimiter:
-            agg_end += self.grammar.delimiters[0]
+            agg_end = f"{agg_keywords[1]}{delim}"
         lines.append(self.format(agg_end, level))
 
         return self.newline.join(lines)
@@ -312,47 +395,45 @@ class PVLEncoder(object):
         if key_len is None:
             key_len = len(key)
 
-        s = ""
-        s += "{} = ".format(key.ljust(key_len))
+        delim = self.grammar.delimiters[0] if self.end_delimiter else ""
+        s = "{} = ".format(key.ljust(key_len))
 
         enc_val = self.encode_value(value)
 
         if enc_val.startswith(self.grammar.quotes):
             # deal with quoted lines that need to preserve
             # newlines
-            s = self.format(s, level)
-            s += enc_val
-
-            if self.end_delimiter:
-                s += self.grammar.delimiters[0]
-
-            return s
+            return f"{self.format(s, level)}{enc_val}{delim}"
         else:
-            s += enc_val
-
-            if self.end_delimiter:
-                s += self.grammar.delimiters[0]
-
-            return self.format(s, level)
+            return self.format(f"{s}{enc_val}{delim}", level)
 
     def encode_value(self, value) -> str:
         """Returns a ``str`` formatted as a PVL Value based
         on the *value* object according to the rules of this encoder.
         """
-        try:
-            return self.encode_quantity(value)
-        except ValueError:
+        if self._find_quantity(value) is None:
             return self.encode_simple_value(value)
+        return self.encode_quantity(value)
+
+    def _find_quantity(self, value):
+        """Returns the QuantTup from this encoder's quantities whose
+        class *value* is an instance of, or None.
+        """
+        for quant in self.quantities:
+            if isinstance(value, quant.cls):
+                return quant
+        return None
 
     def encode_quantity(self, value) -> str:
         """Returns a ``str`` formatted as a PVL Value followed by
         a PVL Units Expression if the *value* object can be
         encoded this way, otherwise raise ValueError."""
-        for (cls, v_prop, u_prop) in self.quantities:
-            if isinstance(value, cls):
-                return self.encode_value_units(
-                    getattr(value, v_prop), getattr(value, u_prop)
-                )
+        quant = self._find_quantity(value)
+        if quant is not None:
+            return self.encode_value_units(
+                getattr(value, quant.value_prop),
+                getattr(value, quant.units_prop)
+            )
 
         raise ValueError(
             f"The value object {value} could not be "
@@ -364,7 +445,7 @@ class PVLEncoder(object):
         """Returns a ``str`` formatted as a PVL Value from *value*
         followed by a PVL Units Expressions from *units*."""
         value_str = self.encode_simple_value(value)
-        units_str = self.encode_units(str(units))
+        units_str = _memoize(self._units_cache, self.encode_units, str(units))
         return f"{value_str} {units_str}"
 
     def encode_simple_value(self, value) -> str:
@@ -373,7 +454,12 @@ class PVLEncoder(object):
         """
         if value is None:
             return self.grammar.none_keyword
-        elif isinstance(value, (set, frozenset)):
+
+        simple_encoder = self._simple_encoders.get(type(value))
+        if simple_encoder is not None:
+            return simple_encoder(value)
+
+        if isinstance(value, (set, frozenset)):
             return self.encode_set(value)
         elif isinstance(value, list):
             return self.encode_sequence(value)
@@ -382,10 +468,7 @@ class PVLEncoder(object):
         ):
             return self.encode_datetype(value)
         elif isinstance(value, bool):
-            if value:
-                return self.grammar.true_keyword
-            else:
-                return self.grammar.false_keyword
+            return self.encode_bool(value)
         elif isinstance(value, self.numeric_types):
             return str(value)
         elif isinstance(value, str):
@@ -393,23 +476,32 @@ class PVLEncoder(object):
         else:
             raise TypeError(f"{value!r} is not serializable.")
 
+    def encode_bool(self, value: bool) -> str:
+        """Returns a ``str`` formatted as a PVL Boolean based
+        on the *value* object according to the rules of this encoder.
+        """
+        if value:
+            return self.grammar.true_keyword
+        else:
+            return self.grammar.false_keyword
+
     def encode_setseq(self, values: abc.Collection) -> str:
         """This function provides shared functionality for
         encode_sequence() and encode_set().
         """
-        return ", ".join([self.encode_value(v) for v in values])
+        return ", ".join(map(self.encode_value, values))
 
     def encode_sequence(self, value: abc.Sequence) -> str:
         """Returns a ``str`` formatted as a PVL Sequence based
         on the *value* object according to the rules of this encoder.
         """
-        return "(" + self.encode_setseq(value) + ")"
+        return f"({self.encode_setseq(value)})"
 
     def encode_set(self, value: abc.Set) -> str:
         """Returns a ``str`` formatted as a PVL Set based
         on the *value* object according to the rules of this encoder.
         """
-        return "{" + self.encode_setseq(value) + "}"
+        return f"{{{self.encode_setseq(value)}}}"
 
     def encode_datetype(self, value) -> str:
         """Returns a ``str`` formatted as a PVL Date/Time based
@@ -455,11 +547,14 @@ class PVLEncoder(object):
         time = self.encode_time(value)
         return date + "T" + time
 
+    def _encode_string_cached(self, value: str) -> str:
+        return _memoize(self._string_cache, self.encode_string, value)
+
     def needs_quotes(self, s: str) -> bool:
         """Returns true if *s* must be quoted according to this
         encoder's grammar, false otherwise.
         """
-        if any(c in self.grammar.whitespace for c in s):
+        if self._quote_re.search(s) is not None:
             return True
 
         if s in self.grammar.reserved_keywords:
@@ -552,12 +647,28 @@ class ODLEncoder(PVLEncoder):
             object_class=object_class
         )
 
+        # Validated and uppercased keywords, only a dict while
+        # encode() is running.
+        self._keyword_cache = None
+
+        self._scalar_types = (
+            *self.numeric_types,
+            datetime.date,
+            datetime.datetime,
+            datetime.time,
+            str
+        )
+
     def encode(self, module: abc.Mapping) -> str:
         """Extends parent function, but ODL requires that there must be
         a spacing or format character after the END statement and this
         adds the encoder's ``newline`` sequence.
         """
-        s = super().encode(module)
+        self._keyword_cache = dict()
+        try:
+            s = super().encode(module)
+        finally:
+            self._keyword_cache = None
         return s + self.newline
 
     def is_scalar(self, value) -> bool:
@@ -576,6 +687,11 @@ class ODLEncoder(PVLEncoder):
         * symbol_value: str
 
         """
+        # Plain numbers are the common case in tables, so test
+        # them before looking for quantities.
+        if isinstance(value, self._scalar_types):
+            return True
+
         for quant in self.quantities:
             if isinstance(value, quant.cls):
                 if isinstance(
@@ -583,16 +699,6 @@ class ODLEncoder(PVLEncoder):
                 ):
                     return True
 
-        scalar_types = (
-            *self.numeric_types,
-            datetime.date,
-            datetime.datetime,
-            datetime.time,
-            str
-        )
-        if isinstance(value, scalar_types):
-            return True
-
         return False
 
     def is_symbol(self, value) -> bool:
@@ -663,6 +769,16 @@ class ODLEncoder(PVLEncoder):
         if key_len is None:
             key_len = len(key)
 
+        ident = _memoize(self._keyword_cache, self._encode_keyword, key)
+
+        delim = self.grammar.delimiters[0] if self.end_delimiter else ""
+        s = "{} = {}{}".format(
+            ident.ljust(key_len), self.encode_value(value), delim
+        )
+
+        return self.format(s, level)
+
+    def _encode_keyword(self, key: str) -> str:
         if len(key) > 30:
             raise ValueError(
                 "ODL keywords must be 30 characters or less "
@@ -672,20 +788,12 @@ class ODLEncoder(PVLEncoder):
         if (
             key.startswith("^") and self.is_assignment_statement(key[1:])
         ) or self.is_assignment_statement(key):
-            ident = key.upper()
+            return key.upper()
         else:
             raise ValueError(
                 f'The keyword "{key}" is not a valid ODL ' "Identifier."
             )
 
-        s = "{} = ".format(ident.ljust(key_len))
-        s += self.encode_value(value)
-
-        if self.end_delimiter:
-            s += self.grammar.delimiters[0]
-
-        return self.format(s, level)
-
     def encode_sequence(self, value) -> str:
         """Extends parent function, as ODL only allows one- and
         two-dimensional sequences of ODL scalar_values.
@@ -908,7 +1016,7 @@ class PDSLabelEncoder(ODLEncoder):
         # in module, it does not 'recurse' if those aggregations also
         # may contain aggregations.
 
-        for k, v in module.items():
+        for v in module.values():
             if isinstance(v, abc.Mapping):
                 if isinstance(v, self.grpcls):
                     grp_count += 1
@@ -21,6 +21,9 @@ labels).
 import argparse
 import logging
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 import pvl
 from .lexer import LexerError
@@ -39,6 +42,12 @@ from .encoder import PVLEncoder, ODLEncoder, ISISEncoder, PDSLabelEncoder
 # We are going to be explicit here, because these arguments are
 # are different than the defaults for these classes, especially for the
 # parsers and decoders, as we want to be strict and not permissive here.
+#
+# These objects are built once, when this module is imported, and are
+# reused for every text that is checked in a process.  Each encoder is
+# bound to its dialect's grammar and decoder, so the PVL and Omni
+# dialects need separate PVLEncoder instances even though they are the
+# same class.
 _pvl_g = PVLGrammar()
 _pvl_d = PVLDecoder(grammar=_pvl_g)
 _odl_g = ODLGrammar()
@@ -83,6 +92,16 @@ dialects = OrderedDict(
     ),
 )
 
+# Report text for the outcomes of pvl_flavor(), and their widths.
+_LOADS = {True: "Loads", False: "does NOT load"}
+_LOADS_W = max(map(len, _LOADS.values()))
+_ENCODES = {True: "Encodes", False: "does NOT encode", None: ""}
+_ENCODES_W = max(map(len, _ENCODES.values()))
+_LOADS_SHORT = {True: "L", False: "No L"}
+_LOADS_SHORT_W = max(map(len, _LOADS_SHORT.values()))
+_ENCODES_SHORT = {True: "E", False: "No E", None: ""}
+_ENCODES_SHORT_W = max(map(len, _ENCODES_SHORT.values()))
+
 
 def arg_parser():
     p = argparse.ArgumentParser(description=__doc__)
@@ -104,19 +123,39 @@ def arg_parser():
 def main(argv=None):
     args = arg_parser().parse_args(argv)
 
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s", level=(60 - 20 * args.verbose)
-    )
-
-    results_list = list()
-    for f in args.file:
-        pvl_text = pvl.get_text_from(f)
+    _config_logging(args.verbose)
 
-        results = dict()
+    texts = [(f, pvl.get_text_from(f)) for f in args.file]
 
-        for k, v in dialects.items():
-            results[k] = pvl_flavor(pvl_text, k, v, f, args.verbose)
+    # Files with identical text don't need to be checked twice, so
+    # each distinct text is checked once, under its first filename.
+    # Later files with that text and any errors say so in the log.
+    unique = dict()
+    for f, pvl_text in texts:
+        unique.setdefault(pvl_text, f)
 
+    flavor_args = (
+        unique.keys(), unique.values(), repeat(args.verbose)
+    )
+    if len(unique) > 1:
+        # Each text is independent and checking it is CPU-bound, so
+        # spread them across processes.  Executor.map() preserves order.
+        with ProcessPoolExecutor() as executor:
+            flavors = list(executor.map(pvl_flavors, *flavor_args))
+    else:
+        flavors = list(map(pvl_flavors, *flavor_args))
+
+    text_results = dict(zip(unique.keys(), flavors))
+    results_list = list()
+    for f, pvl_text in texts:
+        results = text_results[pvl_text]
+        first = unique[pvl_text]
+        if f != first and any(r != (True, True) for r in results.values()):
+            logging.error(
+                "%s has the same text as %s, so it has the same errors.",
+                f,
+                first
+            )
         results_list.append((f, results))
 
     # Writing the flavors out again to preserve order.
@@ -126,6 +165,30 @@ def main(argv=None):
     return
 
 
+def _config_logging(verbose: int):
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s", level=(60 - 20 * verbose)
+    )
+
+
+def pvl_flavors(text, filename, verbose=0) -> dict:
+    """Returns a dict whose keys are the names of the *dialects* and
+    whose values are the two-tuples that :func:`pvl_flavor` returns
+    for the *text* with that dialect.
+
+    This runs in worker processes, so it also sets up logging per
+    *verbose*, in case the process doesn't inherit that from
+    :func:`main`.
+    """
+    _config_logging(verbose)
+
+    results = dict()
+    for k, v in dialects.items():
+        results[k] = pvl_flavor(text, k, v, filename, verbose)
+
+    return results
+
+
 def pvl_flavor(
     text, dialect, decenc: dict, filename, verbose=False
 ) -> tuple((bool, bool)):
@@ -148,19 +211,19 @@ def pvl_flavor(
             pvl.dumps(some_pvl, **decenc)
             encodes = True
         except (LexerError, ParseError, ValueError) as err:
-            logging.error(f"{dialect} encode error {filename} {err}")
+            logging.error("%s encode error %s %s", dialect, filename, err)
             encodes = False
     except (LexerError, ParseError) as err:
-        logging.error(f"{dialect} load error {filename} {err}")
+        logging.error("%s load error %s %s", dialect, filename, err)
         loads = False
     except:  # noqa E722
         if verbose <= 1:
             logging.error(
-                f"{dialect} load error {filename}, try -vv for more info."
+                "%s load error %s, try -vv for more info.", dialect, filename
             )
         else:
-            logging.exception(f"{dialect} load error {filename}")
-            logging.error(f"End {dialect} load error {filename}")
+            logging.exception("%s load error %s", dialect, filename)
+            logging.error("End %s load error %s", dialect, filename)
         loads = False
 
     return loads, encodes
@@ -185,18 +248,11 @@ def report(reports: list, flavors: list) -> str:
     r = reports[0][1]
 
     lines = list()
-    loads = {True: "Loads", False: "does NOT load"}
-    encodes = {True: "Encodes", False: "does NOT encode", None: ""}
-
-    col1w = len(max(flavors, key=len))
-    col2w = len(max(loads.values(), key=len))
-    col3w = len(max(encodes.values(), key=len))
+    widths = [max(map(len, flavors)), _LOADS_W, _ENCODES_W]
 
     for k in flavors:
         lines.append(
-            build_line(
-                [k, loads[r[k][0]], encodes[r[k][1]]], [col1w, col2w, col3w]
-            )
+            build_line([k, _LOADS[r[k][0]], _ENCODES[r[k][1]]], widths)
         )
     return "\n".join(lines)
 
@@ -207,12 +263,10 @@ def report_many(r_list: list, flavors: list) -> str:
     """
 
     lines = list()
-    loads = {True: "L", False: "No L"}
-    encodes = {True: "E", False: "No E", None: ""}
 
-    col1w = len(max([x[0] for x in r_list], key=len))
-    col2w = len(max(loads.values(), key=len))
-    col3w = len(max(encodes.values(), key=len))
+    col1w = max(len(x[0]) for x in r_list)
+    col2w = _LOADS_SHORT_W
+    col3w = _ENCODES_SHORT_W
     flavorw = col2w + col3w + 1
 
     header = ["File"] + flavors
@@ -231,7 +285,10 @@ def report_many(r_list: list, flavors: list) -> str:
             # cells.append(loads[r[1][f][0]] + ' ' + encodes[r[1][f][1]])
             cells.append(
                 "{0:^{w2}} {1:^{w3}}".format(
-                    loads[r[1][f][0]], encodes[r[1][f][1]], w2=col2w, w3=col3w
+                    _LOADS_SHORT[r[1][f][0]],
+                    _ENCODES_SHORT[r[1][f][1]],
+                    w2=col2w,
+                    w3=col3w,
                 )
             )
             widths.append(flavorw)
@@ -244,10 +301,15 @@ def build_line(elements: list, widths: list, sep=" | ") -> str:
     """Returns a string formatted from the *elements* and *widths*
        provided.
     """
-    cells = list()
-    cells.append("{0:<{width}}".format(elements[0], width=widths[0]))
+    n = min(len(elements), len(widths))
+    return _line_template(tuple(widths[:n]), sep).format(*elements[:n])
 
-    for e, w in zip(elements[1:], widths[1:]):
-        cells.append("{0:^{width}}".format(e, width=w))
 
-    return sep.join(cells)
+@lru_cache(maxsize=256)
+def _line_template(widths: tuple, sep: str) -> str:
+    """Returns a format string for build_line() which left-aligns the
+    first cell and centers the rest, in cells of the given *widths*.
+    """
+    cells = [f"{{0:<{widths[0]}}}"]
+    cells.extend(f"{{{i}:^{w}}}" for i, w in enumerate(widths[1:], start=1))
+    return sep.replace("{", "{{").replace("}", "}}").join(cells)
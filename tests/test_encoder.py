@@ -28,6 +28,15 @@ class TestEncoder(unittest.TestCase):
             (k + a60 + "\n" + (" " * len(k)) + b60), self.e.format(s)
         )
 
+        # Changing the indent must not reuse old prefixes.
+        self.assertEqual("  a = b", self.e.format("a = b", 1))
+        self.e.indent = 4
+        self.assertEqual("    a = b", self.e.format("a = b", 1))
+        self.assertEqual(
+            "BEGIN_GROUP = foo;\n    a = b;\nEND_GROUP = foo;",
+            self.e.encode_module(PVLModule(foo=PVLGroup(a="b")))
+        )
+
     def test_encode_string(self):
         s = "ABC"
         self.assertEqual(s, self.e.encode_string(s))
@@ -83,6 +92,7 @@ class TestEncoder(unittest.TestCase):
             (["a", "b", "c"], "(a, b, c)"),
             (datetime.datetime(2001, 1, 1, 2, 3), "2001-01-01T02:03"),
             (True, "TRUE"),
+            (False, "FALSE"),
             (1.23, "1.23"),
             (42, "42"),
             (Decimal("12.30"), "12.30"),
@@ -92,12 +102,34 @@ class TestEncoder(unittest.TestCase):
             with self.subTest(pair=p):
                 self.assertEqual(p[1], self.e.encode_simple_value(p[0]))
 
+    def test_encode_simple_value_override(self):
+        class DateEncoder(PVLEncoder):
+            def encode_datetype(self, value):
+                return "overridden"
+
+        self.assertEqual(
+            "overridden",
+            DateEncoder().encode_simple_value(datetime.date(2001, 1, 1))
+        )
+
+    def test_encode_bool(self):
+        self.assertEqual("TRUE", self.e.encode_bool(True))
+        self.assertEqual("FALSE", self.e.encode_bool(False))
+
     def test_encode_value(self):
         pairs = ((42, "42"), (Quantity(34, "m/s"), "34 <m/s>"))
         for p in pairs:
             with self.subTest(pair=p):
                 self.assertEqual(p[1], self.e.encode_value(p[0]))
 
+        class QuantEncoder(PVLEncoder):
+            def encode_quantity(self, value):
+                return "overridden"
+
+        e = QuantEncoder()
+        self.assertEqual("overridden", e.encode_value(Quantity(34, "m/s")))
+        self.assertEqual("42", e.encode_value(42))
+
     def test_encode_assignment(self):
         self.assertEqual("a = b;", self.e.encode_assignment("a", "b"))
 
@@ -134,6 +166,31 @@ END_GROUP = foo;
 END;"""
         self.assertEqual(s, self.e.encode(m))
 
+        # Changing the indent between calls must not reuse old prefixes.
+        self.e.indent = 4
+        m = PVLModule(foo=PVLGroup(a="b", c="d"))
+        s = "BEGIN_GROUP = foo;\n    a = b;\n    c = d;\nEND_GROUP = foo;\nEND;"
+        self.assertEqual(s, self.e.encode(m))
+
+    def test_encode_bad_char(self):
+        # The error shows the bad character with five characters
+        # of context on either side.
+        pairs = (
+            (PVLModule(a="temp 5☃C"), 'emp 5☃C";\n'),
+            # Near the start, the context is clipped at the beginning.
+            (PVLModule(a="☃"), "a = ☃;\nEN"),
+        )
+        for m, context in pairs:
+            with self.subTest(context=context):
+                with self.assertRaises(ValueError) as cm:
+                    self.e.encode(m)
+                self.assertEqual(
+                    "Encountered a character that was not a valid "
+                    'character according to the grammar: "☃", it is in: '
+                    f'"{context}"',
+                    str(cm.exception)
+                )
+
     def test_encode_quantity(self):
         q, s = Quantity(34, "m/s"), "34 <m/s>"
         self.assertEqual(s, self.e.encode_quantity(q))
@@ -169,6 +226,22 @@ class TestODLEncoder(unittest.TestCase):
     def setUp(self):
         self.e = ODLEncoder()
 
+    def test_encode_assignment(self):
+        self.assertEqual("A = b", self.e.encode_assignment("a", "b"))
+        self.assertEqual("A   = c", self.e.encode_assignment("a", "c", 0, 3))
+        self.assertEqual(
+            "^PTR = 2", self.e.encode_assignment("^ptr", 2)
+        )
+        for k in ("a" * 31, "not valid"):
+            with self.subTest(key=k):
+                self.assertRaises(
+                    ValueError, self.e.encode_assignment, k, "b"
+                )
+                # Invalid keywords are never remembered as valid.
+                self.assertRaises(
+                    ValueError, self.e.encode_assignment, k, "b"
+                )
+
     def test_is_scalar(self):
         self.assertTrue(self.e.is_scalar(5))
         self.assertTrue(self.e.is_scalar("scalar"))
@@ -184,6 +257,12 @@ class TestODLEncoder(unittest.TestCase):
         except ImportError:  # astropy isn't available.
             pass
 
+    def test_encode_value(self):
+        self.assertEqual("34 <m/s>", self.e.encode_value(Quantity(34, "m/s")))
+        self.assertRaises(
+            ValueError, self.e.encode_value, Quantity(34, "m&s")
+        )
+
     def test_encode_time(self):
         t = datetime.time(1, 2)
         self.assertRaises(ValueError, self.e.encode_time, t)
@@ -290,6 +369,22 @@ END_OBJECT = key"""
         e = PDSLabelEncoder(symbol_single_quote=False)
         self.assertEqual('"AB CD"', e.encode_string('AB CD'))
 
+    def test_encode_repeated_strings(self):
+        m = PVLModule(a="AB CD", b="AB CD", c=Quantity(1, "m"))
+        s = "A = 'AB CD'\r\nB = 'AB CD'\r\nC = 1 <m>\r\nEND\r\n"
+        self.assertEqual(s, self.e.encode(m))
+
+        # Remembered encodings must not outlive an encode() call.
+        self.e.symbol_single_quote = False
+        s = 'A = "AB CD"\r\nB = "AB CD"\r\nC = 1 <m>\r\nEND\r\n'
+        self.assertEqual(s, self.e.encode(m))
+
+        # Nor be made outside of one.
+        e = PDSLabelEncoder()
+        self.assertEqual("'AB CD'", e.encode_simple_value("AB CD"))
+        e.symbol_single_quote = False
+        self.assertEqual('"AB CD"', e.encode_simple_value("AB CD"))
+
     def test_encode(self):
         m = PVLModule(a=PVLGroup(g1=2, g2=3.4), b="c")
 
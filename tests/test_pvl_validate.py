@@ -34,6 +34,45 @@ class TestMock(unittest.TestCase):
 
         self.assertIsNone(pvl_val.main(["-v", "dummy.txt"]))
 
+    @patch("pvl.get_text_from", return_value="a=b")
+    def test_main_same_text(self, m_get):
+        with patch(
+            "pvl.pvl_validate.pvl_flavor", return_value=(True, True)
+        ) as m_flavor:
+            pvl_val.main(["one.txt", "two.txt"])
+            self.assertEqual(len(pvl_val.dialects), m_flavor.call_count)
+
+    @patch("pvl.get_text_from", side_effect=["a = b", "foo", "a = b"])
+    def test_main_many_texts(self, m_get):
+        with patch("pvl.pvl_validate.report", return_value="") as m_report:
+            pvl_val.main(["one.txt", "two.txt", "three.txt"])
+            results_list = m_report.call_args[0][0]
+            self.assertEqual(
+                ["one.txt", "two.txt", "three.txt"],
+                [f for f, r in results_list]
+            )
+            self.assertEqual((True, True), results_list[0][1]["PDS3"])
+            self.assertEqual((False, None), results_list[1][1]["PDS3"])
+            self.assertEqual(results_list[0][1], results_list[2][1])
+
+    @patch("pvl.get_text_from", return_value="foo")
+    def test_main_same_text_errors(self, m_get):
+        with patch("pvl.pvl_validate.report", return_value=""):
+            with self.assertLogs(level="ERROR") as cm:
+                pvl_val.main(["-v", "one.txt", "two.txt"])
+        self.assertIn(
+            "ERROR:root:two.txt has the same text as one.txt, so it has "
+            "the same errors.",
+            cm.output
+        )
+
+    def test_pvl_flavors(self):
+        results = pvl_val.pvl_flavors("a = b", "dummy.txt")
+        self.assertEqual(list(pvl_val.dialects.keys()), list(results.keys()))
+        for k, v in results.items():
+            with self.subTest(dialect=k):
+                self.assertEqual((True, True), v)
+
     def test_pvl_flavor(self):
         dialect = "PDS3"
         loads, encodes = pvl_val.pvl_flavor(
@@ -110,3 +149,7 @@ van.txt  | No L No E |  L    E  """,
             "a   |  b  ",
             pvl_val.build_line(['a', 'b'], [3, 4])
         )
+        self.assertEqual(
+            "a   {} b {} c",
+            pvl_val.build_line(['a', 'b', 'c'], [3, 1, 1], sep=" {} ")
+        )